@@ -228,9 +228,13 @@ def __soundfile_load(path, offset, duration, dtype):
 def __audioread_load(path, offset, duration, dtype: DTypeLike):
     """Load an audio buffer using audioread.
 
-    This loads one block at a time, and then concatenates the results.
+    This accumulates the raw PCM bytes one block at a time, and then
+    converts the entire buffer to floating point in a single pass.
     """
-    buf = []
+    buf = bytearray()
+
+    # audioread always produces 16-bit signed integer PCM
+    n_bytes = 2
 
     if isinstance(path, tuple(audioread.available_backends())):
         # If we have an audioread object already, don't bother opening
@@ -253,9 +257,9 @@ def __audioread_load(path, offset, duration, dtype: DTypeLike):
         n = 0
 
         for frame in input_file:
-            frame = util.buf_to_float(frame, dtype=dtype)
+            frame = memoryview(frame)
             n_prev = n
-            n = n + len(frame)
+            n = n + len(frame) // n_bytes
 
             if n < s_start:
                 # offset is after the current frame
@@ -268,17 +272,17 @@ def __audioread_load(path, offset, duration, dtype: DTypeLike):
 
             if s_end < n:
                 # the end is in this frame.  crop.
-                frame = frame[: int(s_end - n_prev)]  # pragma: no cover
+                frame = frame[: int(s_end - n_prev) * n_bytes]  # pragma: no cover
 
             if n_prev <= s_start <= n:
                 # beginning is in this frame
-                frame = frame[(s_start - n_prev) :]
+                frame = frame[(s_start - n_prev) * n_bytes :]
 
             # tack on the current frame
-            buf.append(frame)
+            buf.extend(frame)
 
     if buf:
-        y = np.concatenate(buf)
+        y = util.buf_to_float(buf, n_bytes=n_bytes, dtype=dtype)
         if n_channels > 1:
             y = y.reshape((-1, n_channels)).T
     else:
@@ -664,16 +668,18 @@ def resample(
             samplerate.resample, axis=axis, arr=y, ratio=ratio, converter_type=res_type
         )
     elif res_type.startswith("soxr"):
-        # Use numpy to vectorize the resampler along the target axis
-        # This is because soxr does not support ndim>2 generally.
-        y_hat = np.apply_along_axis(
-            soxr.resample,
-            axis=axis,
-            arr=y,
+        # soxr natively resamples multi-channel input of shape (samples, channels).
+        # Move the target axis to the front and flatten all remaining axes
+        # into channels, so that everything is resampled in a single call.
+        y_chan = np.moveaxis(y, axis, 0)
+        y_hat = soxr.resample(
+            y_chan.reshape((y_chan.shape[0], -1)),
             in_rate=orig_sr,
             out_rate=target_sr,
             quality=res_type,
         )
+        y_hat = y_hat.reshape((-1,) + y_chan.shape[1:])
+        y_hat = np.ascontiguousarray(np.moveaxis(y_hat, 0, axis))
     else:
         y_hat = resampy.resample(y, orig_sr, target_sr, filter=res_type, axis=axis)
 
@@ -917,12 +923,14 @@ def autocorrelate(
 
     real = not np.iscomplexobj(y)
 
-    # Pad out the signal to support full-length auto-correlation
+    # Pad out the signal to support auto-correlation up to max_size lags.
+    # Lags beyond max_size are discarded, so we only need enough padding
+    # to prevent circular wrap-around on the retained lags.
     if hasattr(scipy.fft, "next_fast_len"):
-        n_pad = scipy.fft.next_fast_len(2 * y.shape[axis] - 1, real=real)
+        n_pad = scipy.fft.next_fast_len(y.shape[axis] + max_size - 1, real=real)
     else:
         # TODO: Bump to scipy>=1.4.0 and remove this branch
-        n_pad = scipy.fftpack.next_fast_len(2 * y.shape[axis] - 1)
+        n_pad = scipy.fftpack.next_fast_len(y.shape[axis] + max_size - 1)
 
     if real:
         # Compute the power spectrum along the chosen axis
@@ -1159,6 +1159,15 @@ def hz_to_note(
     return midi_to_note(hz_to_midi(frequencies), **kwargs)
 
 
+# Parameters of the Slaney mel scale, which is linear below 1 kHz
+# and logarithmic above
+_MEL_F_MIN = 0.0
+_MEL_F_SP = 200.0 / 3
+_MEL_MIN_LOG_HZ = 1000.0  # beginning of log region (Hz)
+_MEL_MIN_LOG_MEL = (_MEL_MIN_LOG_HZ - _MEL_F_MIN) / _MEL_F_SP  # same (Mels)
+_MEL_LOGSTEP = np.log(6.4) / 27.0  # step size for log region
+
+
 @overload
 def hz_to_mel(frequencies: _FloatLike_co, *, htk: bool = ...) -> np.floating[Any]:
     ...
@@ -1213,24 +1222,19 @@ def hz_to_mel(
         return mels
 
     # Fill in the linear part
-    f_min = 0.0
-    f_sp = 200.0 / 3
-
-    mels = (frequencies - f_min) / f_sp
+    mels = (frequencies - _MEL_F_MIN) / _MEL_F_SP
 
     # Fill in the log-scale part
-
-    min_log_hz = 1000.0  # beginning of log region (Hz)
-    min_log_mel = (min_log_hz - f_min) / f_sp  # same (Mels)
-    logstep = np.log(6.4) / 27.0  # step size for log region
-
     if frequencies.ndim:
         # If we have array data, vectorize
-        log_t = frequencies >= min_log_hz
-        mels[log_t] = min_log_mel + np.log(frequencies[log_t] / min_log_hz) / logstep
-    elif frequencies >= min_log_hz:
+        log_t = frequencies >= _MEL_MIN_LOG_HZ
+        mels[log_t] = (
+            _MEL_MIN_LOG_MEL
+            + np.log(frequencies[log_t] / _MEL_MIN_LOG_HZ) / _MEL_LOGSTEP
+        )
+    elif frequencies >= _MEL_MIN_LOG_HZ:
         # If we have scalar data, heck directly
-        mels = min_log_mel + np.log(frequencies / min_log_hz) / logstep
+        mels = _MEL_MIN_LOG_MEL + np.log(frequencies / _MEL_MIN_LOG_HZ) / _MEL_LOGSTEP
 
     return mels
 
@@ -1287,22 +1291,18 @@ def mel_to_hz(
         return 700.0 * (10.0 ** (mels / 2595.0) - 1.0)
 
     # Fill in the linear scale
-    f_min = 0.0
-    f_sp = 200.0 / 3
-    freqs = f_min + f_sp * mels
+    freqs = _MEL_F_MIN + _MEL_F_SP * mels
 
     # And now the nonlinear scale
-    min_log_hz = 1000.0  # beginning of log region (Hz)
-    min_log_mel = (min_log_hz - f_min) / f_sp  # same (Mels)
-    logstep = np.log(6.4) / 27.0  # step size for log region
-
     if mels.ndim:
         # If we have vector data, vectorize
-        log_t = mels >= min_log_mel
-        freqs[log_t] = min_log_hz * np.exp(logstep * (mels[log_t] - min_log_mel))
-    elif mels >= min_log_mel:
+        log_t = mels >= _MEL_MIN_LOG_MEL
+        freqs[log_t] = _MEL_MIN_LOG_HZ * np.exp(
+            _MEL_LOGSTEP * (mels[log_t] - _MEL_MIN_LOG_MEL)
+        )
+    elif mels >= _MEL_MIN_LOG_MEL:
         # If we have scalar data, check directly
-        freqs = min_log_hz * np.exp(logstep * (mels - min_log_mel))
+        freqs = _MEL_MIN_LOG_HZ * np.exp(_MEL_LOGSTEP * (mels - _MEL_MIN_LOG_MEL))
 
     return freqs
 
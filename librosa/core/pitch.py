@@ -9,6 +9,7 @@ import numba
 
 
 from .spectrum import _spectrogram
+from .fft import get_fftlib
 from . import convert
 from .._cache import cache
 from .. import util
@@ -390,9 +391,11 @@ def _cumulative_mean_normalized_difference(
         Cumulative mean normalized difference function for each frame.
     """
     # Autocorrelation.
-    a = np.fft.rfft(y_frames, frame_length, axis=-2)
-    b = np.fft.rfft(y_frames[..., win_length:0:-1, :], frame_length, axis=-2)
-    acf_frames = np.fft.irfft(a * b, frame_length, axis=-2)[..., win_length:, :]
+    fft = get_fftlib()
+    a = fft.rfft(y_frames, frame_length, axis=-2)
+    b = fft.rfft(y_frames[..., win_length:0:-1, :], frame_length, axis=-2)
+    a *= b
+    acf_frames = fft.irfft(a, frame_length, axis=-2)[..., win_length:, :]
     acf_frames[np.abs(acf_frames) < 1e-6] = 0
 
     # Energy terms.
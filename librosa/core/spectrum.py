@@ -240,6 +240,10 @@ def stft(
 
     fft_window = get_window(window, win_length, fftbins=True)
 
+    # Match the precision of the input signal, so that windowed frames
+    # are not promoted to double precision
+    fft_window = fft_window.astype(y.dtype, copy=False)
+
     # Pad the window out to n_fft size
     fft_window = util.pad_center(fft_window, size=n_fft)
 
@@ -563,7 +567,8 @@ def istft(
         start_frame = int(np.ceil((n_fft // 2) / hop_length))
 
         # Do overlap-add on the head block
-        ytmp = ifft_window * fft.irfft(stft_matrix[..., :start_frame], n=n_fft, axis=-2)
+        ytmp = fft.irfft(stft_matrix[..., :start_frame], n=n_fft, axis=-2)
+        ytmp *= ifft_window
 
         shape[-1] = n_fft + hop_length * (start_frame - 1)
         head_buffer = np.zeros(shape, dtype=dtype)
@@ -594,8 +599,9 @@ def istft(
     for bl_s in range(start_frame, n_frames, n_columns):
         bl_t = min(bl_s + n_columns, n_frames)
 
-        # invert the block and apply the window function
-        ytmp = ifft_window * fft.irfft(stft_matrix[..., bl_s:bl_t], n=n_fft, axis=-2)
+        # invert the block and apply the window function in-place
+        ytmp = fft.irfft(stft_matrix[..., bl_s:bl_t], n=n_fft, axis=-2)
+        ytmp *= ifft_window
 
         # Overlap-add the istft block starting at the i'th frame
         __overlap_add(y[..., frame * hop_length + offset :], ytmp, hop_length)
@@ -633,14 +639,23 @@ def __overlap_add(y, ytmp, hop_length):
     # ytmp is the windowed inverse-stft frames
     # hop_length is the hop-length of the STFT analysis
 
+    # Leading (channel) dimensions are iterated explicitly so that the
+    # inner loop is a scalar accumulation and does not allocate
+    # temporary array expressions.
+
     n_fft = ytmp.shape[-2]
-    N = n_fft
-    for frame in range(ytmp.shape[-1]):
-        sample = frame * hop_length
-        if N > y.shape[-1] - sample:
-            N = y.shape[-1] - sample
+    for idx in np.ndindex(y.shape[:-1]):
+        y_ch = y[idx]
+        ytmp_ch = ytmp[idx]
 
-        y[..., sample : (sample + N)] += ytmp[..., :N, frame]
+        N = n_fft
+        for frame in range(ytmp_ch.shape[-1]):
+            sample = frame * hop_length
+            if N > y_ch.shape[-1] - sample:
+                N = y_ch.shape[-1] - sample
+
+            for i in range(N):
+                y_ch[sample + i] += ytmp_ch[i, frame]
 
 
 def __reassign_frequencies(
@@ -1435,40 +1450,46 @@ def phase_vocoder(
 
     time_steps = np.arange(0, D.shape[-1], rate, dtype=np.float64)
 
-    # Create an empty output array
-    shape = list(D.shape)
-    shape[-1] = len(time_steps)
-    d_stretch = np.zeros_like(D, shape=shape)
-
     # Expected phase advance in each bin per frame
     phi_advance = hop_length * convert.fft_frequencies(sr=2 * np.pi, n_fft=n_fft)
+    phi_advance = util.expand_to(phi_advance, ndim=D.ndim, axes=-2)
+    phi_advance = phi_advance.astype(util.dtype_c2r(D.dtype), copy=False)
 
-    # Phase accumulator; initialize to the first sample
-    phase_acc = np.angle(D[..., 0])
+    # Phase of the first frame, used to initialize the accumulator
+    phase_0 = np.angle(D[..., :1])
 
     # Pad 0 columns to simplify boundary logic
     padding = [(0, 0) for _ in D.shape]
     padding[-1] = (0, 2)
     D = np.pad(D, padding, mode="constant")
 
-    for t, step in enumerate(time_steps):
-        columns = D[..., int(step) : int(step + 2)]
+    # Magnitude and phase of each input column, computed once
+    mag_in = np.abs(D)
+    phase_in = np.angle(D)
 
-        # Weighting for linear magnitude interpolation
-        alpha = np.mod(step, 1.0)
-        mag = (1.0 - alpha) * np.abs(columns[..., 0]) + alpha * np.abs(columns[..., 1])
+    # Index of the left input column bracketing each output frame
+    idx = time_steps.astype(int)
 
-        # Store to output array
-        d_stretch[..., t] = util.phasor(phase_acc, mag=mag)
+    # Weighting for linear magnitude interpolation
+    alpha = np.mod(time_steps, 1.0).astype(mag_in.dtype)
+    mag = (1.0 - alpha) * mag_in[..., idx] + alpha * mag_in[..., idx + 1]
 
-        # Compute phase advance
-        dphase = np.angle(columns[..., 1]) - np.angle(columns[..., 0]) - phi_advance
+    # Compute phase advance
+    dphase = phase_in[..., idx + 1] - phase_in[..., idx] - phi_advance
 
-        # Wrap to -pi:pi range
-        dphase = dphase - 2.0 * np.pi * np.round(dphase / (2.0 * np.pi))
+    # Wrap to -pi:pi range
+    dphase -= 2.0 * np.pi * np.round(dphase / (2.0 * np.pi))
 
-        # Accumulate phase
-        phase_acc += phi_advance + dphase
+    # Accumulate phase: each output frame uses the advances of all preceding frames
+    phase_acc = np.cumsum(phi_advance + dphase, axis=-1)
+    phase_acc[..., 1:] = phase_acc[..., :-1]
+    phase_acc[..., :1] = 0
+    phase_acc += phase_0
+
+    # Store to output array
+    d_stretch: np.ndarray = util.phasor(phase_acc, mag=mag).astype(
+        D.dtype, copy=False
+    )
 
     return d_stretch
 
@@ -1811,13 +1832,19 @@ def power_to_db(
     else:
         ref_value = np.abs(ref)
 
-    log_spec: np.ndarray = 10.0 * np.log10(np.maximum(amin, magnitude))
-    log_spec -= 10.0 * np.log10(np.maximum(amin, ref_value))
+    # Work in-place on a single buffer to avoid allocating temporaries
+    log_spec: np.ndarray = np.maximum(amin, magnitude)
+    out_array = log_spec if isinstance(log_spec, np.ndarray) else None
+    log_spec = np.log10(log_spec, out=out_array)
+    log_spec = np.multiply(log_spec, 10.0, out=out_array)
+    log_spec = np.subtract(
+        log_spec, 10.0 * np.log10(np.maximum(amin, ref_value)), out=out_array
+    )
 
     if top_db is not None:
         if top_db < 0:
             raise ParameterError("top_db must be non-negative")
-        log_spec = np.maximum(log_spec, log_spec.max() - top_db)
+        log_spec = np.maximum(log_spec, log_spec.max() - top_db, out=out_array)
 
     return log_spec
 
@@ -1958,16 +1985,21 @@ def amplitude_to_db(
             stacklevel=2,
         )
 
-    magnitude = np.abs(S)
-
-    if callable(ref):
-        # User supplied a function to calculate reference power
-        ref_value = ref(magnitude)
-    else:
+    if np.iscomplexobj(S) and not callable(ref):
+        # The magnitude itself is not needed, so square it directly
         ref_value = np.abs(ref)
+        power = util.abs2(S)
+    else:
+        magnitude = np.abs(S)
+
+        if callable(ref):
+            # User supplied a function to calculate reference power
+            ref_value = ref(magnitude)
+        else:
+            ref_value = np.abs(ref)
 
-    out_array = magnitude if isinstance(magnitude, np.ndarray) else None
-    power = np.square(magnitude, out=out_array)
+        out_array = magnitude if isinstance(magnitude, np.ndarray) else None
+        power = np.square(magnitude, out=out_array)
 
     db: np.ndarray = power_to_db(power, ref=ref_value**2, amin=amin**2, top_db=top_db)
     return db
@@ -2940,19 +2972,22 @@ def _spectrogram(
             raise ParameterError(
                 "Input signal must be provided to compute a spectrogram"
             )
-        S = (
-            np.abs(
-                stft(
-                    y,
-                    n_fft=n_fft,
-                    hop_length=hop_length,
-                    win_length=win_length,
-                    center=center,
-                    window=window,
-                    pad_mode=pad_mode,
-                )
-            )
-            ** power
+        D = stft(
+            y,
+            n_fft=n_fft,
+            hop_length=hop_length,
+            win_length=win_length,
+            center=center,
+            window=window,
+            pad_mode=pad_mode,
         )
 
+        if power == 2:
+            # Squared magnitude directly, without the intermediate |D|
+            S = util.abs2(D)
+        else:
+            S = np.abs(D)
+            if power != 1:
+                S **= power
+
     return S, n_fft
@@ -2,6 +2,9 @@
 # -*- coding: utf-8 -*-
 """Spectral feature extraction"""
 
+import functools
+
+import numba
 import numpy as np
 import scipy
 import scipy.signal
@@ -1415,6 +1418,20 @@ def chroma_cqt(
     return chroma
 
 
+@numba.vectorize(
+    ["float32(float32, float32)", "float64(float64, float64)"],
+    nopython=True,
+    cache=True,
+)
+def __cens_quantize(x, step):  # pragma: no cover
+    """Quantize normalized chroma energy in a single pass.
+
+    Each of the thresholds step, step/2, step/4, step/8 exceeded
+    contributes 0.25.
+    """
+    return 0.25 * ((x > step) + (x > step / 2) + (x > step / 4) + (x > step / 8))
+
+
 def chroma_cens(
     *,
     y: Optional[np.ndarray] = None,
@@ -1538,14 +1555,9 @@ def chroma_cens(
     # L1-Normalization
     chroma = util.normalize(chroma, norm=1, axis=-2)
 
-    # Quantize amplitudes
-    QUANT_STEPS = [0.4, 0.2, 0.1, 0.05]
-    QUANT_WEIGHTS = [0.25, 0.25, 0.25, 0.25]
-
-    chroma_quant = np.zeros_like(chroma)
-
-    for cur_quant_step_idx, cur_quant_step in enumerate(QUANT_STEPS):
-        chroma_quant += (chroma > cur_quant_step) * QUANT_WEIGHTS[cur_quant_step_idx]
+    # Quantize amplitudes at steps of 0.4, 0.2, 0.1, 0.05.
+    # The largest step is given at the precision of the chroma.
+    chroma_quant = __cens_quantize(chroma, chroma.dtype.type(0.4))
 
     if win_len_smooth:
         # Apply temporal smoothing
@@ -1830,6 +1842,18 @@ def tonnetz(
 
 
 # -- Mel spectrogram and MFCCs -- #
+@functools.lru_cache(maxsize=64)
+def __dct_basis(
+    n_input: int, n_output: int, dct_type: int, norm: Optional[str], dtype: DTypeLike
+) -> np.ndarray:
+    """In-memory cache of the truncated DCT matrix used by `mfcc`"""
+    basis: np.ndarray = scipy.fftpack.dct(
+        np.eye(n_input, dtype=dtype), axis=0, type=dct_type, norm=norm
+    )[:n_output]
+    basis.flags.writeable = False
+    return basis
+
+
 def mfcc(
     *,
     y: Optional[np.ndarray] = None,
@@ -1991,9 +2015,14 @@ def mfcc(
         # multichannel behavior may be different due to relative noise floor differences between channels
         S = power_to_db(melspectrogram(y=y, sr=sr, norm = mel_norm, **kwargs))
 
-    M: np.ndarray = scipy.fftpack.dct(S, axis=-2, type=dct_type, norm=norm)[
-        ..., :n_mfcc, :
-    ]
+    # Only the first n_mfcc coefficients are retained, so project onto the
+    # truncated DCT basis rather than transforming all of the mel bands
+    if np.issubdtype(S.dtype, np.inexact):
+        dct_dtype = np.result_type(S.dtype, np.float32)
+    else:
+        dct_dtype = np.dtype(np.float64)
+    dct_basis = __dct_basis(S.shape[-2], n_mfcc, dct_type, norm, dct_dtype)
+    M: np.ndarray = np.matmul(dct_basis, S)
 
     if lifter > 0:
         # shape lifter for broadcasting
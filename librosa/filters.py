@@ -42,6 +42,7 @@ Deprecated
     constant_q_lengths
 
 """
+import functools
 import warnings
 
 import numpy as np
@@ -217,9 +218,7 @@ def mel(
     if fmax is None:
         fmax = float(sr) / 2
 
-    # Initialize the weights
     n_mels = int(n_mels)
-    weights = np.zeros((n_mels, int(1 + n_fft // 2)), dtype=dtype)
 
     # Center freqs of each FFT bin
     fftfreqs = fft_frequencies(sr=sr, n_fft=n_fft)
@@ -230,13 +229,14 @@ def mel(
     fdiff = np.diff(mel_f)
     ramps = np.subtract.outer(mel_f, fftfreqs)
 
-    for i in range(n_mels):
-        # lower and upper slopes for all bins
-        lower = -ramps[i] / fdiff[i]
-        upper = ramps[i + 2] / fdiff[i + 1]
+    # lower and upper slopes for all filters and bins
+    lower = ramps[:-2] / -fdiff[:-1, np.newaxis]
+    upper = ramps[2:] / fdiff[1:, np.newaxis]
 
-        # .. then intersect them with each other and zero
-        weights[i] = np.maximum(0, np.minimum(lower, upper))
+    # .. then intersect them with each other and zero
+    np.minimum(lower, upper, out=lower)
+    np.maximum(lower, 0, out=lower)
+    weights = lower.astype(dtype, copy=False)
 
     if isinstance(norm, str):
         if norm == "slaney":
@@ -363,10 +363,12 @@ def chroma(
     >>> ax.set(ylabel='Chroma filter', title='Chroma filter bank')
     >>> fig.colorbar(img, ax=ax)
     """
-    wts = np.zeros((n_chroma, n_fft))
+    # Only the non-aliased bins are retained, but we need one more
+    # to compute the bin width of the last retained bin
+    n_bins = int(1 + n_fft // 2)
 
     # Get the FFT bins, not counting the DC component
-    frequencies = np.linspace(0, sr, n_fft, endpoint=False)[1:]
+    frequencies = np.linspace(0, sr, n_fft, endpoint=False)[1 : n_bins + 1]
 
     frqbins = n_chroma * hz_to_octs(
         frequencies, tuning=tuning, bins_per_octave=n_chroma
@@ -388,23 +390,20 @@ def chroma(
     D = np.remainder(D + n_chroma2 + 10 * n_chroma, n_chroma) - n_chroma2
 
     # Gaussian bumps - 2*D to make them narrower
-    wts = np.exp(-0.5 * (2 * D / np.tile(binwidthbins, (n_chroma, 1))) ** 2)
+    wts = np.exp(-0.5 * (2 * D / binwidthbins[np.newaxis, :]) ** 2)
 
     # normalize each column
     wts = util.normalize(wts, norm=norm, axis=0)
 
     # Maybe apply scaling for fft bins
     if octwidth is not None:
-        wts *= np.tile(
-            np.exp(-0.5 * (((frqbins / n_chroma - ctroct) / octwidth) ** 2)),
-            (n_chroma, 1),
-        )
+        wts *= np.exp(-0.5 * (((frqbins / n_chroma - ctroct) / octwidth) ** 2))
 
     if base_c:
         wts = np.roll(wts, -3 * (n_chroma // 12), axis=0)
 
-    # remove aliasing columns, copy to ensure row-contiguity
-    return np.ascontiguousarray(wts[:, : int(1 + n_fft / 2)], dtype=dtype)
+    # remove the extra column, copy to ensure row-contiguity
+    return np.ascontiguousarray(wts[:, :n_bins], dtype=dtype)
 
 
 def __float_window(window_spec):
@@ -1227,7 +1226,15 @@ def get_window(
     elif isinstance(window, (str, tuple)) or np.isscalar(window):
         # TODO: if we add custom window functions in librosa, call them here
 
-        win: np.ndarray = scipy.signal.get_window(window, Nx, fftbins=fftbins)
+        win: np.ndarray
+        try:
+            # Window specifications are usually hashable, so we can reuse
+            # previously computed windows.  The cached array is shared, so
+            # hand the caller a copy.
+            win = __get_window_memo(window, Nx, fftbins).copy()
+        except TypeError:
+            # Tuple specifications may contain unhashable parameters
+            win = scipy.signal.get_window(window, Nx, fftbins=fftbins)
         return win
 
     elif isinstance(window, (np.ndarray, list)):
@@ -1239,6 +1246,14 @@ def get_window(
         raise ParameterError(f"Invalid window specification: {window!r}")
 
 
+@functools.lru_cache(maxsize=64)
+def __get_window_memo(window: _WindowSpec, Nx: int, fftbins: Optional[bool]) -> np.ndarray:
+    """In-memory cache of window functions computed by `scipy.signal.get_window`"""
+    win: np.ndarray = scipy.signal.get_window(window, Nx, fftbins=fftbins)
+    win.flags.writeable = False
+    return win
+
+
 @cache(level=10)
 def _multirate_fb(
     center_freqs: Optional[np.ndarray] = None,
@@ -36,7 +36,7 @@ from __future__ import annotations
 import numpy as np
 from scipy.spatial.distance import cdist
 from numba import jit
-from .util import pad_center, fill_off_diagonal, is_positive_int, tiny, expand_to
+from .util import fill_off_diagonal, is_positive_int, tiny, expand_to
 from .util.exceptions import ParameterError
 from .filters import get_window
 from typing import Any, Iterable, List, Optional, Tuple, Union, overload
@@ -2027,21 +2027,23 @@ def transition_local(
     if np.any(width < 1):
         raise ParameterError(f"width={width} must be at least 1")
 
+    if np.any(width > n_states):
+        raise ParameterError(f"width={width} must be at most n_states={n_states}")
+
     transition = np.zeros((n_states, n_states), dtype=np.float64)
 
-    # Fill in the widths.  This is inefficient, but simple
+    # Fill in the widths.  Each window is written directly at the position
+    # it would occupy after centering and rolling a full row, so no padded
+    # copy of the row is needed.
     for i, width_i in enumerate(width):
-        trans_row = pad_center(
-            get_window(window, width_i, fftbins=False), size=n_states
-        )
-        trans_row = np.roll(trans_row, n_states // 2 + i + 1)
+        offset = (n_states - width_i) // 2 + n_states // 2 + i + 1
+        cols = np.mod(offset + np.arange(width_i), n_states)
+        transition[i, cols] = get_window(window, width_i, fftbins=False)
 
         if not wrap:
             # Knock out the off-diagonal-band elements
-            trans_row[min(n_states, i + width_i // 2 + 1) :] = 0
-            trans_row[: max(0, i - width_i // 2)] = 0
-
-        transition[i] = trans_row
+            transition[i, min(n_states, i + width_i // 2 + 1) :] = 0
+            transition[i, : max(0, i - width_i // 2)] = 0
 
     # Row-normalize
     transition /= transition.sum(axis=1, keepdims=True)
@@ -460,6 +460,21 @@ def pad_center(
             f"Target size ({size:d}) must be at least input size ({n:d})"
         )
 
+    if kwargs == {"mode": "constant"}:
+        # Zero-padding: allocate the output directly and copy the data
+        # into place, bypassing the general-purpose machinery of np.pad
+        shape = list(data.shape)
+        shape[axis] = size
+        order: Literal["C", "F"] = "F" if data.flags.fnc else "C"
+        data_padded: np.ndarray = np.zeros(
+            tuple(shape), dtype=data.dtype, order=order
+        )
+
+        idx = [slice(None)] * data.ndim
+        idx[axis] = slice(lpad, lpad + n)
+        data_padded[tuple(idx)] = data
+        return data_padded
+
     return np.pad(data, lengths, **kwargs)
 
 
@@ -659,18 +674,14 @@ def fix_frames(
     if np.any(frames < 0):
         raise ParameterError("Negative frame index detected")
 
-    # TODO: this whole function could be made more efficient
-
     if pad and (x_min is not None or x_max is not None):
         frames = np.clip(frames, x_min, x_max)
 
     if pad:
-        pad_data = []
-        if x_min is not None:
-            pad_data.append(x_min)
-        if x_max is not None:
-            pad_data.append(x_max)
-        frames = np.concatenate((np.asarray(pad_data), frames))
+        # Add the endpoints in order, so already-sorted input stays sorted
+        head = [x_min] if x_min is not None else []
+        tail = [x_max] if x_max is not None else []
+        frames = np.concatenate((np.asarray(head), frames, np.asarray(tail)))
 
     if x_min is not None:
         frames = frames[frames >= x_min]
@@ -678,7 +689,18 @@ def fix_frames(
     if x_max is not None:
         frames = frames[frames <= x_max]
 
-    unique: np.ndarray = np.unique(frames).astype(int)
+    frames = frames.ravel()
+
+    # Frame indices are usually sorted already, so only sort when needed
+    if np.any(frames[1:] < frames[:-1]):
+        frames = np.sort(frames)
+
+    # Remove duplicates from the sorted frames
+    keep = np.empty(frames.shape, dtype=bool)
+    keep[:1] = True
+    np.not_equal(frames[1:], frames[:-1], out=keep[1:])
+
+    unique: np.ndarray = frames[keep].astype(int)
     return unique
 
 
@@ -1036,18 +1058,6 @@ def normalize(
     return Snorm
 
 
-@numba.stencil
-def _localmax_sten(x):  # pragma: no cover
-    """Numba stencil for local maxima computation"""
-    return (x[0] > x[-1]) & (x[0] >= x[1])
-
-
-@numba.stencil
-def _localmin_sten(x):  # pragma: no cover
-    """Numba stencil for local minima computation"""
-    return (x[0] < x[-1]) & (x[0] <= x[1])
-
-
 @numba.guvectorize(
     [
         "void(int16[:], bool_[:])",
@@ -1061,8 +1071,14 @@ def _localmin_sten(x):  # pragma: no cover
     nopython=True,
 )
 def _localmax(x, y):  # pragma: no cover
-    """Vectorized wrapper for the localmax stencil"""
-    y[:] = _localmax_sten(x)
+    """Vectorized local maxima kernel, excluding the final element"""
+    n = x.shape[0]
+    if n > 0:
+        y[0] = False
+    for i in range(1, n - 1):
+        y[i] = (x[i] > x[i - 1]) & (x[i] >= x[i + 1])
+    if n > 1:
+        y[n - 1] = False
 
 
 @numba.guvectorize(
@@ -1078,8 +1094,14 @@ def _localmax(x, y):  # pragma: no cover
     nopython=True,
 )
 def _localmin(x, y):  # pragma: no cover
-    """Vectorized wrapper for the localmin stencil"""
-    y[:] = _localmin_sten(x)
+    """Vectorized local minima kernel, excluding the final element"""
+    n = x.shape[0]
+    if n > 0:
+        y[0] = False
+    for i in range(1, n - 1):
+        y[i] = (x[i] < x[i - 1]) & (x[i] <= x[i + 1])
+    if n > 1:
+        y[n - 1] = False
 
 
 def localmax(x: np.ndarray, *, axis: int = 0) -> np.ndarray:
@@ -1134,10 +1156,10 @@ def localmax(x: np.ndarray, *, axis: int = 0) -> np.ndarray:
     lmax = np.empty_like(x, dtype=bool)
     lmaxi = lmax.swapaxes(-1, axis)
 
-    # Call the vectorized stencil
+    # Call the vectorized kernel
     _localmax(xi, lmaxi)
 
-    # Handle the edge condition not covered by the stencil
+    # Handle the edge condition not covered by the kernel
     lmaxi[..., -1] = xi[..., -1] > xi[..., -2]
 
     return lmax
@@ -1196,10 +1218,10 @@ def localmin(x: np.ndarray, *, axis: int = 0) -> np.ndarray:
     lmin = np.empty_like(x, dtype=bool)
     lmini = lmin.swapaxes(-1, axis)
 
-    # Call the vectorized stencil
+    # Call the vectorized kernel
     _localmin(xi, lmini)
 
-    # Handle the edge condition not covered by the stencil
+    # Handle the edge condition not covered by the kernel
     lmini[..., -1] = xi[..., -1] < xi[..., -2]
 
     return lmin
@@ -1473,7 +1495,10 @@ def sparsify_rows(
 
 
 def buf_to_float(
-    x: np.ndarray, *, n_bytes: int = 2, dtype: DTypeLike = np.float32
+    x: Union[np.ndarray, bytes, bytearray, memoryview],
+    *,
+    n_bytes: int = 2,
+    dtype: DTypeLike = np.float32,
 ) -> np.ndarray:
     """Convert an integer buffer to floating point values.
     This is primarily useful when loading integer-valued wav data
@@ -1481,7 +1506,7 @@ def buf_to_float(
 
     Parameters
     ----------
-    x : np.ndarray [dtype=int]
+    x : np.ndarray [dtype=int] or bytes-like
         The integer-valued data buffer
     n_bytes : int [1, 2, 4]
         The number of bytes per sample in ``x``
@@ -1500,7 +1525,9 @@ def buf_to_float(
     fmt = f"<i{n_bytes:d}"
 
     # Rescale and format the data buffer
-    return scale * np.frombuffer(x, fmt).astype(dtype)
+    x_float: np.ndarray = np.frombuffer(x, fmt).astype(dtype)
+    x_float *= scale
+    return x_float
 
 
 def index_to_slice(
@@ -1664,12 +1691,16 @@ def sync(
 
     shape = list(data.shape)
 
+    # Slices generated from frame indices are contiguous
+    index_slices: Optional[List[slice]] = None
+
     if np.all([isinstance(_, slice) for _ in idx]):
         slices = idx
     elif np.all([np.issubdtype(type(_), np.integer) for _ in idx]):
-        slices = index_to_slice(
+        index_slices = index_to_slice(
             np.asarray(idx), idx_min=0, idx_max=shape[axis], pad=pad
         )
+        slices = index_slices
     else:
         raise ParameterError(f"Invalid index set: {idx}")
 
@@ -1683,6 +1714,35 @@ def sync(
     idx_in = [slice(None)] * data.ndim
     idx_agg = [slice(None)] * data_agg.ndim
 
+    if index_slices and (aggregate is np.mean or aggregate is np.sum):
+        # Segments are contiguous and non-empty, so all sums can be
+        # computed in a single pass with reduceat.
+        # reduceat accumulates sequentially, so floating point data uses
+        # (at least) double precision to avoid round-off on long segments.
+        # Integer data accumulates as in np.sum, or in float64 for np.mean.
+        if np.issubdtype(data.dtype, np.inexact):
+            acc_dtype = np.result_type(data.dtype, np.float64)
+        elif aggregate is np.mean:
+            acc_dtype = np.dtype(np.float64)
+        elif np.issubdtype(data.dtype, np.unsignedinteger):
+            acc_dtype = np.result_type(data.dtype, np.uint)
+        else:
+            acc_dtype = np.result_type(data.dtype, np.int_)
+
+        starts = np.asarray([segment.start for segment in index_slices])
+        stops = np.asarray([segment.stop for segment in index_slices])
+
+        idx_in[axis] = slice(None, stops[-1])
+        data_sum = np.add.reduceat(
+            data[tuple(idx_in)], starts, axis=axis, dtype=acc_dtype
+        )
+
+        if aggregate is np.mean:
+            data_sum = data_sum / expand_to(stops - starts, ndim=data.ndim, axes=axis)
+
+        data_agg[...] = data_sum
+        return data_agg
+
     for i, segment in enumerate(slices):
         idx_in[axis] = segment  # type: ignore
         idx_agg[axis] = i  # type: ignore
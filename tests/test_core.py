@@ -2192,6 +2192,31 @@ def test_reset_fftlib():
     assert librosa.get_fftlib() is fft
 
 
+def test_yin_fftlib():
+    import numpy.fft as fft
+
+    calls = []
+
+    class RecordingFFT:
+        # Forward to numpy.fft, but record which transforms were used
+        def __getattr__(self, name):
+            calls.append(name)
+            return getattr(fft, name)
+
+    y = librosa.tone(440, duration=0.5, sr=22050)
+    f0 = librosa.yin(y, fmin=110, fmax=880, sr=22050)
+
+    try:
+        librosa.set_fftlib(RecordingFFT())  # type: ignore
+        f0_fftlib = librosa.yin(y, fmin=110, fmax=880, sr=22050)
+    finally:
+        librosa.set_fftlib()
+
+    assert "rfft" in calls
+    assert "irfft" in calls
+    assert np.allclose(f0, f0_fftlib)
+
+
 @pytest.fixture
 def y_chirp():
     sr = 22050
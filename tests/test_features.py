@@ -4,6 +4,7 @@
 from __future__ import print_function
 import warnings
 import numpy as np
+import scipy.fftpack
 
 import pytest
 
@@ -794,6 +795,19 @@ def test_mfcc(S, dct_type, norm, n_mfcc, lifter):
         assert np.var(mfcc[0] / E_total) <= 1e-29
 
 
+@pytest.mark.parametrize("dct_type, norm", [(1, None), (2, None), (2, "ortho"), (3, "ortho")])
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_mfcc_dct_basis(dct_type, norm, dtype):
+    srand()
+    S = np.random.randn(2, 40, 10).astype(dtype)
+
+    mfcc = librosa.feature.mfcc(S=S, dct_type=dct_type, norm=norm, n_mfcc=13)
+    mfcc_full = scipy.fftpack.dct(S, axis=-2, type=dct_type, norm=norm)[..., :13, :]
+
+    assert mfcc.dtype == mfcc_full.dtype
+    assert np.allclose(mfcc, mfcc_full, rtol=1e-4, atol=1e-4)
+
+
 # This test is no longer relevant since scipy 1.2.0
 # @pytest.mark.xfail(raises=NotImplementedError)
 # def test_mfcc_dct1_ortho():
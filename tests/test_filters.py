@@ -479,6 +479,23 @@ def test_get_window(window):
     assert np.allclose(w1, w2)
 
 
+def test_get_window_copy():
+    # Repeated calls must not share a buffer, even if the window is cached
+    w1 = librosa.filters.get_window("hann", 32)
+    w1[:] = 0
+    w2 = librosa.filters.get_window("hann", 32)
+
+    assert w2.flags.writeable
+    assert np.allclose(w2, scipy.signal.get_window("hann", 32))
+
+
+def test_get_window_unhashable():
+    window = ("general_cosine", np.array([0.5, 0.5]))
+    w1 = librosa.filters.get_window(window, 32)
+    w2 = scipy.signal.get_window(window, 32)
+    assert np.allclose(w1, w2)
+
+
 def test_get_window_func():
 
     w1 = librosa.filters.get_window(scipy.signal.windows.boxcar, 32)
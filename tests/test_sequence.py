@@ -567,7 +567,7 @@ def test_trans_local_nstates_fail(n):
 
 
 @pytest.mark.xfail(raises=librosa.ParameterError)
-@pytest.mark.parametrize("width", [-1, 0, [2, 3]])
+@pytest.mark.parametrize("width", [-1, 0, 6, [2, 3]])
 def test_trans_local_width_fail(width):
     librosa.sequence.transition_local(5, width)
 
@@ -187,6 +187,32 @@ def test_fix_frames(frames, x_min, x_max, pad):
         assert np.all(f_fix <= x_max)
 
 
+@pytest.mark.parametrize(
+    "frames", [[50, 5, 50, 90, 20, 5, 130], [5, 5, 20, 20, 50, 90, 130]]
+)
+@pytest.mark.parametrize("x_min", [None, 0, 20])
+@pytest.mark.parametrize("x_max", [None, 70, 150])
+@pytest.mark.parametrize("pad", [False, True])
+def test_fix_frames_unique(frames, x_min, x_max, pad):
+    f_fix = librosa.util.fix_frames(frames, x_min=x_min, x_max=x_max, pad=pad)
+
+    # Compare against a sort-based reference
+    f_ref = np.asarray(frames)
+    pad_data = [x for x in (x_min, x_max) if x is not None]
+    if pad and pad_data:
+        f_ref = np.clip(f_ref, x_min, x_max)
+    if pad:
+        f_ref = np.concatenate([pad_data, f_ref])
+    if x_min is not None:
+        f_ref = f_ref[f_ref >= x_min]
+    if x_max is not None:
+        f_ref = f_ref[f_ref <= x_max]
+    f_ref = np.unique(f_ref).astype(int)
+
+    assert f_fix.dtype == f_ref.dtype
+    assert np.array_equal(f_fix, f_ref)
+
+
 @pytest.mark.xfail(raises=librosa.ParameterError)
 @pytest.mark.parametrize("frames", [np.arange(-20, 100)])
 @pytest.mark.parametrize("x_min", [None, 0, 20])
@@ -895,6 +921,31 @@ def test_sync_frames(aggregate, atype):
         assert False
 
 
+@pytest.mark.parametrize("aggregate", [np.mean, np.sum])
+@pytest.mark.parametrize("axis", [0, 1, -1])
+@pytest.mark.parametrize("dtype", [np.float32, np.complex64, np.int32, np.int64])
+def test_sync_frames_match_slices(aggregate, axis, dtype):
+    # Frame boundaries take a vectorized path for mean and sum;
+    # check that it agrees with explicit slice aggregation
+    rng = np.random.default_rng(0)
+    x = (100 * rng.standard_normal((20, 50, 30))).astype(dtype)
+    if dtype == np.int64:
+        # Values beyond 2**53 are not exactly representable in float64
+        x += 2**53
+    frames = [0, 3, 4, 10, x.shape[axis]]
+    slices = [slice(a, b) for (a, b) in zip(frames, frames[1:])]
+
+    xsync_frames = librosa.util.sync(x, frames, aggregate=aggregate, axis=axis)
+    xsync_slices = librosa.util.sync(x, slices, aggregate=aggregate, axis=axis)
+
+    assert xsync_frames.dtype == xsync_slices.dtype
+    if np.issubdtype(dtype, np.integer) and aggregate is np.sum:
+        # Integer sums must be exact
+        assert np.array_equal(xsync_frames, xsync_slices)
+    else:
+        assert np.allclose(xsync_frames, xsync_slices, rtol=1e-5, atol=1e-3)
+
+
 @pytest.mark.parametrize("atype", [list, np.asarray])
 @pytest.mark.parametrize("pad", [False, True])
 def test_sync_frames_pad(atype, pad):